@@ -1,26 +1,215 @@
 """3-stage LLM Council orchestration."""
 
-from typing import List, Dict, Any, Tuple, Optional
+from typing import AsyncIterator, FrozenSet, List, Dict, Any, Set, Tuple, Optional
+import asyncio
+import io
+import math
+import os
 import re
-import toon
 import json
-from .openrouter import query_models_parallel, query_model
+from .openrouter import query_models_parallel, query_models_as_completed, query_model, query_model_stream
 from .config import COUNCIL_MODELS, CHAIRMAN_MODEL
-from .tools import get_available_tools
-from .memory import CouncilMemorySystem
+from .memory import CouncilMemorySystem, get_embeddings, get_response_cache
+
+# Seconds to wait for slow council members once the first stage-1 answer lands
+# (unset = wait for every model)
+_STRAGGLER_TIMEOUT = os.getenv("COUNCIL_STRAGGLER_TIMEOUT")
+
+# Skip stages 2 and 3 when every pair of stage-1 answers is at least this
+# similar (cosine); unset disables the short-circuit
+_SKIP_THRESHOLD = os.getenv("COUNCIL_SKIP_THRESHOLD")
+
+# In-flight and recently finished run_full_council calls, keyed by
+# (user_query, conversation_id), plus how long finished results are reused
+_INFLIGHT: Dict[Tuple[str, Optional[str]], "asyncio.Task"] = {}
+_DEDUP_WINDOW = float(os.getenv("COUNCIL_DEDUP_WINDOW", "30"))
+
+# Per-response token cap for the stage-2 ranking prompt (0 = no cap); stage 3
+# still receives the full responses
+_MAX_STAGE1_TOKENS = int(os.getenv("COUNCIL_MAX_STAGE1_TOKENS", "0") or 0)
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+_BG_TASKS: Set["asyncio.Task"] = set()
+
+# Conversation history window for stage 1: at least _CONTEXT_WINDOW messages,
+# with the start advancing every _CONTEXT_STEP messages
+_CONTEXT_WINDOW = 6
+_CONTEXT_STEP = 6
+
+# Ranking parsers (compiled once; parse_ranking_from_text runs per evaluation)
+_FINAL_RE = re.compile(r'FINAL RANKING:(.*?)(?=FINAL RANKING:|\Z)', re.DOTALL)
+_NUMBERED_RE = re.compile(r'\d+\.\s*(Response [A-Z])')
+_FALLBACK_RE = re.compile(r'Response [A-Z]')
+
+# Tool intent keywords, matched as plain substrings of the lowercased query
+_INTENT_KEYWORDS = {
+    "finance": ("price", "stock", "stocks", "shares", "ticker", "market cap", "quote"),
+    "calc": ("calculate", "compute", "math", "sum", "multiply", "divide", "add", "subtract"),
+    "search": ("search", "latest", "news", "current", "recent"),
+    "research": ("wikipedia", "wiki", "research", "paper", "arxiv", "definition", "history"),
+}
+_INTENT_BY_KEYWORD = {
+    keyword: intent
+    for intent, keywords in _INTENT_KEYWORDS.items()
+    for keyword in keywords
+}
+# Longest keywords first so e.g. "stocks" wins over "stock" at the same position
+_INTENT_RE = re.compile(
+    "(?=(" + "|".join(
+        re.escape(keyword) for keyword in sorted(_INTENT_BY_KEYWORD, key=len, reverse=True)
+    ) + "))"
+)
+
+# Tools run by run_tools_for_query outside the finance path, in priority
+# order, with the intent each requires (None = always eligible)
+_GENERAL_TOOLS = (
+    ("calculator", "calc"),
+    ("wikipedia", "research"),
+    ("arxiv", "research"),
+    ("web_search", "search"),
+    ("tavily_search", None),
+)
+
+# Ticker extraction tables
+_TOKEN_RE = re.compile(r"\b[A-Z]{1,10}\b")
+
+_STOP_WORDS = frozenset({
+    "THE", "AND", "FOR", "WITH", "TODAY", "PRICE", "STOCK", "STOCKS", "HOW",
+    "WHAT", "IS", "ARE", "OF", "IN", "ON", "TO", "BY", "VS", "VERSUS", "GOOD",
+    "BETTER", "BAD", "SHARE", "SHARES", "MARKET", "QUESTION", "ABOUT"
+})
+
+_NAME_MAP = {
+    "APPLE": "AAPL",
+    "TESLA": "TSLA",
+    "GOOGLE": "GOOGL",
+    "ALPHABET": "GOOGL",
+    "MICROSOFT": "MSFT",
+    "AMAZON": "AMZN",
+    "META": "META",
+    "FACEBOOK": "META",
+    "NVIDIA": "NVDA",
+    "NETFLIX": "NFLX",
+    "AMD": "AMD",
+    "IBM": "IBM",
+    "SHOPIFY": "SHOP",
+    "SNOW": "SNOW",
+}
+
+# tiktoken encoder, loaded on first use
+_ENCODER = None
+
+
+def _get_encoder():
+    """Return the cl100k_base encoder, loading it once per process."""
+    global _ENCODER
+    if _ENCODER is None:
+        import tiktoken
+
+        _ENCODER = tiktoken.get_encoding("cl100k_base")
+    return _ENCODER
+
+
+def _spawn_background(coro) -> "asyncio.Task":
+    """Run a coroutine off the response path, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _BG_TASKS.add(task)
+    task.add_done_callback(_BG_TASKS.discard)
+    return task
+
+
+async def drain_background_tasks():
+    """Wait for outstanding background work (call on application shutdown)."""
+    if _BG_TASKS:
+        await asyncio.gather(*list(_BG_TASKS), return_exceptions=True)
+
+
+def _truncate_for_ranking(text: str, max_tokens: Optional[int] = None) -> str:
+    """Cap a stage-1 response at max_tokens (default COUNCIL_MAX_STAGE1_TOKENS)."""
+    if max_tokens is None:
+        max_tokens = _MAX_STAGE1_TOKENS
+    # Cheap early exit: a token is at least one character
+    if max_tokens <= 0 or len(text) <= max_tokens:
+        return text
+    try:
+        enc = _get_encoder()
+    except Exception:
+        return text
+    tokens = enc.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens]) + "... [truncated]"
+
+
+def _context_window_start(num_messages: int) -> int:
+    """Index of the first history message to include in the stage-1 prompt."""
+    if num_messages <= _CONTEXT_WINDOW:
+        return 0
+    return (num_messages - _CONTEXT_WINDOW) // _CONTEXT_STEP * _CONTEXT_STEP
+
+
+def _format_context(history: List[Dict[str, Any]]) -> str:
+    """Render history messages as 'User:' / 'Council:' lines for the stage-1 prompt."""
+    context_buf = io.StringIO()
+    for msg in history:
+        if msg['role'] == 'user':
+            context_buf.write(f"User: {msg['content']}\n\n")
+        elif msg['role'] == 'assistant' and 'stage3' in msg:
+            # Use final council answer from Stage 3
+            final_answer = msg['stage3']['response']
+            # Truncate if too long (keep first 200 chars)
+            if len(final_answer) > 200:
+                final_answer = final_answer[:200] + "..."
+            context_buf.write(f"Council: {final_answer}\n\n")
+    return context_buf.getvalue().strip()
+
+
+def _build_context_messages(context: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Render conversation history as the system messages that open the stage-1 prompt.
+
+    Keeps roughly the last 3 exchanges, but only advances the window start in
+    fixed steps. History up to the last step boundary goes in its own message,
+    which stays byte-identical across turns and carries the prompt-cache
+    breakpoint; the newer messages follow uncached. Positions are absolute,
+    so `context` must be the full history, not a client-side tail.
+
+    Args:
+        context: Every earlier message of the conversation, oldest first
+
+    Returns:
+        Zero, one or two system messages
+    """
+    start = _context_window_start(len(context))
+    boundary = len(context) // _CONTEXT_STEP * _CONTEXT_STEP
+    stable_text = _format_context(context[start:boundary])
+    recent_text = _format_context(context[boundary:])
+
+    messages = []
+    if stable_text:
+        messages.append({
+            "role": "system",
+            "content": f"Previous conversation:\n\n{stable_text}",
+            "cacheable": True
+        })
+    if recent_text:
+        header = "Previous conversation (continued)" if stable_text else "Previous conversation"
+        messages.append({"role": "system", "content": f"{header}:\n\n{recent_text}"})
+    return messages
 
 
 async def stage1_collect_responses(
     user_query: str,
     context: Optional[List[Dict[str, Any]]] = None,
-    conversation_id: Optional[str] = None
+    memory: Optional[CouncilMemorySystem] = None
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, str]]]:
     """
     Stage 1: Collect individual responses from all council models.
 
     Args:
         user_query: The user's question
-        context: Previous messages for conversation continuity
+        context: Full conversation history (oldest first) for continuity
+        memory: Conversation memory to pull relevant past exchanges from
 
     Returns:
         Tuple of (stage1_results, tool_outputs)
@@ -29,41 +218,22 @@ async def stage1_collect_responses(
     messages = []
 
     # Add context if available
-    if context and len(context) > 0:
-        # Take last 6 messages (3 exchanges) to avoid token limit
-        recent_context = context[-6:]
-
-        # Build context summary
-        context_text = "Previous conversation:\n\n"
-        for msg in recent_context:
-            if msg['role'] == 'user':
-                context_text += f"User: {msg['content']}\n\n"
-            elif msg['role'] == 'assistant' and 'stage3' in msg:
-                # Use final council answer from Stage 3
-                final_answer = msg['stage3']['response']
-                # Truncate if too long (keep first 200 chars)
-                if len(final_answer) > 200:
-                    final_answer = final_answer[:200] + "..."
-                context_text += f"Council: {final_answer}\n\n"
-
-        # Add context as system message
-        messages.append({
-            "role": "system",
-            "content": context_text.strip()
-        })
+    if context:
+        messages.extend(_build_context_messages(context))
 
     # Memory-based context
     memory_ctx = ""
-    if conversation_id:
-        memory = CouncilMemorySystem(conversation_id)
-        memory_ctx = memory.get_context(user_query)
+    if memory is not None:
+        # Query embedding + Chroma search block; keep them off the event loop
+        memory_ctx = await asyncio.to_thread(memory.get_context, user_query)
         if memory_ctx:
             messages.append({"role": "system", "content": f"Relevant past exchanges:\n{memory_ctx}"})
 
     # Add tool context if the query suggests tool usage
     tool_outputs: List[Dict[str, str]] = []
-    if requires_tools(user_query):
-        tool_outputs = run_tools_for_query(user_query)
+    intents = detect_tool_intents(user_query)
+    if intents:
+        tool_outputs = await run_tools_for_query(user_query, intents=intents)
         if tool_outputs:
             tool_text = "Tool outputs:\n" + "\n".join(
                 f"- {item['tool']}: {item['result']}" for item in tool_outputs
@@ -73,17 +243,51 @@ async def stage1_collect_responses(
     # Add current query
     messages.append({"role": "user", "content": user_query})
 
-    # Query all models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
-
-    # Format results
-    stage1_results = []
-    for model, response in responses.items():
-        if response is not None:  # Only include successful responses
-            stage1_results.append({
-                "model": model,
-                "response": response.get('content', '')
-            })
+    # Serve near-duplicate queries from the semantic cache where possible.
+    # Embedding and Chroma calls block, so they run in worker threads
+    # (including the first get_response_cache(), which loads the model).
+    cache = await asyncio.to_thread(get_response_cache)
+    context_hash = cache.context_hash(messages[:-1])
+    query_embedding = await asyncio.to_thread(cache.embed, user_query) if cache.enabled else None
+    cached: Dict[str, Dict[str, Any]] = {}
+    if query_embedding is not None:
+        hits = await asyncio.gather(*[
+            asyncio.to_thread(cache.lookup, query_embedding, model, context_hash)
+            for model in COUNCIL_MODELS
+        ])
+        for model, hit in zip(COUNCIL_MODELS, hits):
+            if hit is not None:
+                cached[model] = {"content": hit}
+
+    # Query remaining models in parallel
+    pending_models = [model for model in COUNCIL_MODELS if model not in cached]
+    straggler_timeout = float(_STRAGGLER_TIMEOUT) if _STRAGGLER_TIMEOUT else None
+    fresh: Dict[str, Dict[str, Any]] = {}
+    async for model, response in query_models_as_completed(
+        pending_models, messages, straggler_timeout=straggler_timeout
+    ):
+        fresh[model] = response
+
+    if query_embedding is not None:
+        _spawn_background(asyncio.to_thread(
+            cache.store,
+            user_query,
+            context_hash,
+            {
+                model: response['content']
+                for model, response in fresh.items()
+                if response.get('content')
+            },
+            query_embedding,
+        ))
+
+    # Format results in council order (both sources hold successful responses only)
+    responses = {**cached, **fresh}
+    stage1_results = [
+        {"model": model, "response": responses[model].get('content', '')}
+        for model in COUNCIL_MODELS
+        if model in responses
+    ]
 
     return stage1_results, tool_outputs
 
@@ -112,10 +316,10 @@ async def stage2_collect_rankings(
     }
 
     # Build the ranking prompt
-    responses_text = "\n\n".join([
-        f"Response {label}:\n{result['response']}"
+    responses_text = "\n\n".join(
+        f"Response {label}:\n{_truncate_for_ranking(result['response'] or '')}"
         for label, result in zip(labels, stage1_results)
-    ])
+    )
 
     ranking_prompt = f"""You are evaluating different responses to the following question:
 
@@ -155,41 +359,53 @@ Now provide your evaluation and ranking:"""
 
     # Format results
     stage2_results = []
-    for model, response in responses.items():
-        if response is not None:
-            full_text = response.get('content', '')
-            parsed = parse_ranking_from_text(full_text)
-            stage2_results.append({
-                "model": model,
-                "ranking": full_text,
-                "parsed_ranking": parsed
-            })
+    for model, response in responses:
+        full_text = response.get('content', '')
+        stage2_results.append({
+            "model": model,
+            "ranking": full_text,
+            "parsed_ranking": parse_ranking_from_text(full_text)
+        })
 
     return stage2_results, label_to_model
 
 
-async def stage3_synthesize_final(
-    user_query: str,
+def encode_stage_results(
     stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]],
-    tool_outputs: Optional[List[Dict[str, str]]] = None
-) -> Dict[str, Any]:
+    stage2_results: List[Dict[str, Any]]
+) -> Tuple[str, str]:
     """
-    Stage 3: Chairman synthesizes final response.
-
-    Args:
-        user_query: The original user query
-        stage1_results: Individual model responses from Stage 1
-        stage2_results: Rankings from Stage 2
+    Encode stage 1 and stage 2 results as TOON once per request.
 
     Returns:
-        Dict with 'model' and 'response' keys
+        Tuple of (stage1_toon, stage2_toon)
     """
-    # Build comprehensive context for chairman using TOON format
-    # TOON reduces token usage by 30-60% compared to JSON/text formatting
-    stage1_text = toon.encode(stage1_results)
-    stage2_text = toon.encode(stage2_results)
+    import toon
+
+    return toon.encode(stage1_results), toon.encode(stage2_results)
+
+
+async def encode_stage_results_async(
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]]
+) -> Tuple[str, str]:
+    """Like encode_stage_results, but encodes both stages in worker threads."""
+    import toon
+
+    stage1_toon, stage2_toon = await asyncio.gather(
+        asyncio.to_thread(toon.encode, stage1_results),
+        asyncio.to_thread(toon.encode, stage2_results)
+    )
+    return stage1_toon, stage2_toon
+
 
+def _build_chairman_messages(
+    user_query: str,
+    stage1_text: str,
+    stage2_text: str,
+    tool_outputs: Optional[List[Dict[str, str]]] = None
+) -> List[Dict[str, str]]:
+    """Build the Stage 3 chairman prompt from TOON-encoded stage results."""
     tools_text = ""
     if tool_outputs:
         tools_text = "TOOL OUTPUTS:\n" + "\n".join(
@@ -215,7 +431,36 @@ Your task as Chairman is to synthesize all of this information into a single, co
 
 Provide a clear, well-reasoned final answer that represents the council's collective wisdom:"""
 
-    messages = [{"role": "user", "content": chairman_prompt}]
+    return [{"role": "user", "content": chairman_prompt}]
+
+
+async def stage3_synthesize_final(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    tool_outputs: Optional[List[Dict[str, str]]] = None,
+    stage1_toon: Optional[str] = None,
+    stage2_toon: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Stage 3: Chairman synthesizes final response.
+
+    Args:
+        user_query: The original user query
+        stage1_results: Individual model responses from Stage 1
+        stage2_results: Rankings from Stage 2
+        stage1_toon: Pre-encoded TOON for stage1_results (encoded here if omitted)
+        stage2_toon: Pre-encoded TOON for stage2_results (encoded here if omitted)
+
+    Returns:
+        Dict with 'model' and 'response' keys
+    """
+    # Build comprehensive context for chairman using TOON format
+    # TOON reduces token usage by 30-60% compared to JSON/text formatting
+    if stage1_toon is None or stage2_toon is None:
+        stage1_toon, stage2_toon = await encode_stage_results_async(stage1_results, stage2_results)
+
+    messages = _build_chairman_messages(user_query, stage1_toon, stage2_toon, tool_outputs)
 
     # Query the chairman model
     response = await query_model(CHAIRMAN_MODEL, messages)
@@ -233,6 +478,29 @@ Provide a clear, well-reasoned final answer that represents the council's collec
     }
 
 
+async def stage3_synthesize_final_stream(
+    user_query: str,
+    stage1_results: List[Dict[str, Any]],
+    stage2_results: List[Dict[str, Any]],
+    tool_outputs: Optional[List[Dict[str, str]]] = None,
+    stage1_toon: Optional[str] = None,
+    stage2_toon: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Stage 3, streamed: yield the chairman's answer as text deltas.
+
+    Takes the same arguments as stage3_synthesize_final. If the chairman
+    request fails, the error is raised after any deltas already yielded.
+    """
+    if stage1_toon is None or stage2_toon is None:
+        stage1_toon, stage2_toon = await encode_stage_results_async(stage1_results, stage2_results)
+
+    messages = _build_chairman_messages(user_query, stage1_toon, stage2_toon, tool_outputs)
+
+    async for delta in query_model_stream(CHAIRMAN_MODEL, messages):
+        yield delta
+
+
 def parse_ranking_from_text(ranking_text: str) -> List[str]:
     """
     Parse the FINAL RANKING section from the model's response.
@@ -243,128 +511,126 @@ def parse_ranking_from_text(ranking_text: str) -> List[str]:
     Returns:
         List of response labels in ranked order
     """
-    import re
-
     # Look for "FINAL RANKING:" section
-    if "FINAL RANKING:" in ranking_text:
-        # Extract everything after "FINAL RANKING:"
-        parts = ranking_text.split("FINAL RANKING:")
-        if len(parts) >= 2:
-            ranking_section = parts[1]
-            # Try to extract numbered list format (e.g., "1. Response A")
-            # This pattern looks for: number, period, optional space, "Response X"
-            numbered_matches = re.findall(r'\d+\.\s*Response [A-Z]', ranking_section)
-            if numbered_matches:
-                # Extract just the "Response X" part
-                return [re.search(r'Response [A-Z]', m).group() for m in numbered_matches]
-
-            # Fallback: Extract all "Response X" patterns in order
-            matches = re.findall(r'Response [A-Z]', ranking_section)
-            return matches
-
-    # Fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r'Response [A-Z]', ranking_text)
-    return matches
-
-
-def _has_finance_signal(query: str) -> bool:
-    q = query.lower()
-    finance_signals = {"price", "stock", "stocks", "shares", "ticker", "market cap", "quote"}
-    return any(sig in q for sig in finance_signals)
-
-
-def _has_calc_signal(query: str) -> bool:
-    q = query.lower()
-    calc_signals = {"calculate", "compute", "math", "sum", "multiply", "divide", "add", "subtract"}
-    return any(sig in q for sig in calc_signals)
-
+    final_match = _FINAL_RE.search(ranking_text)
+    if final_match:
+        ranking_section = final_match.group(1)
+        # Try to extract numbered list format (e.g., "1. Response A")
+        numbered_matches = _NUMBERED_RE.findall(ranking_section)
+        if numbered_matches:
+            return numbered_matches
 
-def _has_search_signal(query: str) -> bool:
-    q = query.lower()
-    search_signals = {"search", "latest", "news", "current", "recent"}
-    return any(sig in q for sig in search_signals)
+        # Fallback: Extract all "Response X" patterns in order
+        return _FALLBACK_RE.findall(ranking_section)
 
+    # Fallback: try to find any "Response X" patterns in order
+    return _FALLBACK_RE.findall(ranking_text)
 
-def _has_research_signal(query: str) -> bool:
-    q = query.lower()
-    research_signals = {"wikipedia", "wiki", "research", "paper", "arxiv", "definition", "history"}
-    return any(sig in q for sig in research_signals)
 
+def detect_tool_intents(query: str) -> FrozenSet[str]:
+    """
+    Scan the query once and return the tool intents it signals.
 
-def requires_tools(query: str) -> bool:
-    """Heuristic: only run tools when signals are clear."""
-    return (
-        _has_finance_signal(query)
-        or _has_calc_signal(query)
-        or _has_search_signal(query)
-        or _has_research_signal(query)
+    The zero-width lookahead tries every keyword at every position, so
+    overlapping keywords (e.g. "search" inside "research") are all found,
+    matching plain substring checks.
+    """
+    return frozenset(
+        _INTENT_BY_KEYWORD[match.group(1)]
+        for match in _INTENT_RE.finditer(query.lower())
     )
 
 
-def run_tools_for_query(query: str, limit: int = 3) -> List[Dict[str, str]]:
+async def run_tools_for_query(
+    query: str,
+    limit: int = 3,
+    intents: Optional[FrozenSet[str]] = None
+) -> List[Dict[str, str]]:
     """
     Run available tools against the query to enrich context.
+    Independent tools run concurrently in worker threads.
+    Pass `intents` from detect_tool_intents() to avoid rescanning the query.
     Returns a list of {tool, result} entries.
     """
+    if intents is None:
+        intents = detect_tool_intents(query)
+
     results: List[Dict[str, str]] = []
-    tools = get_available_tools()
-    stock_tool = next((t for t in tools if t.name == "stock_data"), None)
-    web_tool = next((t for t in tools if t.name == "web_search"), None)
-    finance_intent = _has_finance_signal(query)
+    tools = _available_tools()
+    web_used = False
+    finance_intent = "finance" in intents
+    # Only construct the finance/search tools when the query needs them
+    stock_tool = tools.get("stock_data") if finance_intent else None
+    web_tool = tools.get("web_search") if finance_intent else None
 
     # If ticker-like symbols are present, try them first (in order)
     if finance_intent:
         tickers = extract_ticker_candidates(query)
         if tickers and stock_tool:
-            results.extend(run_stock_for_tickers(stock_tool, tickers, limit))
+            results.extend(await asyncio.to_thread(run_stock_for_tickers, stock_tool, tickers, limit))
             if results:
                 return results
 
         # Fallback: try to infer tickers from web search output, then query stock tool
         if not results and stock_tool and web_tool:
+            web_used = True
             try:
-                web_output = web_tool.run(query)
+                web_output = await asyncio.to_thread(web_tool.run, query)
                 inferred_tickers = extract_ticker_candidates(str(web_output))
                 if inferred_tickers:
-                    results.extend(run_stock_for_tickers(stock_tool, inferred_tickers, limit))
+                    results.extend(
+                        await asyncio.to_thread(run_stock_for_tickers, stock_tool, inferred_tickers, limit)
+                    )
                     if results:
                         return results
             except Exception:
                 pass
 
-    for tool in tools:
-        # Skip stock tool here; handled above
-        if tool.name == "stock_data":
-            continue
+    eligible = []
+    for name, intent in _GENERAL_TOOLS:
+        if len(results) + len(eligible) >= limit:
+            break
         # Skip web tool if it was already used for inference
-        if tool.name == "web_search" and web_tool is not None:
+        if name == "web_search" and web_used:
             continue
-        if len(results) >= limit:
-            break
         # Skip tools that don't match intent
-        if tool.name == "calculator":
-            if not _has_calc_signal(query):
-                continue
-        if tool.name == "wikipedia" or tool.name == "arxiv":
-            if not _has_research_signal(query):
-                continue
-        if tool.name == "web_search":
-            if not _has_search_signal(query):
-                continue
-        try:
-            output = tool.run(query)
-            if output:
-                # Truncate very long outputs to keep prompts tight
-                if isinstance(output, str) and len(output) > 500:
-                    output = output[:500] + "..."
-                results.append({"tool": tool.name, "result": str(output)})
-        except Exception:
-            # Silently skip tool failures to avoid breaking the request path
+        if intent is not None and intent not in intents:
             continue
+        tool = tools.get(name)
+        if tool is not None:
+            eligible.append(tool)
+
+    outputs = await asyncio.gather(
+        *[asyncio.to_thread(_run_tool, tool, query) for tool in eligible],
+        return_exceptions=True
+    )
+    # Silently skip tool failures to avoid breaking the request path
+    results.extend(
+        output for output in outputs
+        if output is not None and not isinstance(output, BaseException)
+    )
 
     return results
 
 
+def _available_tools():
+    """Return the enabled tools as a LazyToolList (see tools.get_available_tools)."""
+    from .tools import get_available_tools
+
+    return get_available_tools()
+
+
+def _run_tool(tool, query: str) -> Optional[Dict[str, str]]:
+    """Run a single tool, returning a {tool, result} entry or None if empty."""
+    output = tool.run(query)
+    if not output:
+        return None
+    # Truncate very long outputs to keep prompts tight
+    if isinstance(output, str) and len(output) > 500:
+        output = output[:500] + "..."
+    return {"tool": tool.name, "result": str(output)}
+
+
 def run_stock_for_tickers(stock_tool, tickers: List[str], limit: int) -> List[Dict[str, str]]:
     """Run stock tool for a list of tickers and return valid price outputs."""
     results: List[Dict[str, str]] = []
@@ -398,50 +664,16 @@ def extract_ticker_candidates(text: str) -> List[str]:
     if not text:
         return []
 
-    stop_words = {
-        "THE", "AND", "FOR", "WITH", "TODAY", "PRICE", "STOCK", "STOCKS", "HOW",
-        "WHAT", "IS", "ARE", "OF", "IN", "ON", "TO", "BY", "VS", "VERSUS", "GOOD",
-        "BETTER", "BAD", "SHARE", "SHARES", "MARKET", "QUESTION", "ABOUT"
-    }
-
-    name_map = {
-        "APPLE": "AAPL",
-        "TESLA": "TSLA",
-        "GOOGLE": "GOOGL",
-        "ALPHABET": "GOOGL",
-        "MICROSOFT": "MSFT",
-        "AMAZON": "AMZN",
-        "META": "META",
-        "FACEBOOK": "META",
-        "NVIDIA": "NVDA",
-        "NETFLIX": "NFLX",
-        "AMD": "AMD",
-        "IBM": "IBM",
-        "SHOPIFY": "SHOP",
-        "SNOW": "SNOW",
-    }
-
-    tokens = re.findall(r"\b[A-Z]{1,10}\b", text.upper())
-    seen = set()
-    candidates: List[str] = []
-
-    for tok in tokens:
-        mapped = name_map.get(tok)
-        if mapped:
-            if mapped not in seen:
-                seen.add(mapped)
-                candidates.append(mapped)
-            continue
-
-        if tok in stop_words:
-            continue
-
-        if 1 <= len(tok) <= 5:
-            if tok not in seen:
-                seen.add(tok)
-                candidates.append(tok)
+    tokens = _TOKEN_RE.findall(text.upper())
 
-    return candidates
+    # Map company names to tickers, keep short non-stop-word tokens, and
+    # deduplicate while preserving first appearance
+    candidates = (
+        _NAME_MAP.get(tok, tok)
+        for tok in tokens
+        if tok in _NAME_MAP or (len(tok) <= 5 and tok not in _STOP_WORDS)
+    )
+    return list(dict.fromkeys(candidates))
 
 
 def calculate_aggregate_rankings(
@@ -458,32 +690,31 @@ def calculate_aggregate_rankings(
     Returns:
         List of dicts with model name and average rank, sorted best to worst
     """
-    from collections import defaultdict
-
-    # Track positions for each model
-    model_positions = defaultdict(list)
+    # Running (sum, count) of positions per model
+    totals: Dict[str, List[int]] = {}
 
     for ranking in stage2_results:
-        ranking_text = ranking['ranking']
-
-        # Parse the ranking from the structured format
-        parsed_ranking = parse_ranking_from_text(ranking_text)
+        # Reuse the ranking parsed in stage 2; only re-parse older payloads
+        parsed_ranking = ranking.get('parsed_ranking')
+        if parsed_ranking is None:
+            parsed_ranking = parse_ranking_from_text(ranking['ranking'])
 
         for position, label in enumerate(parsed_ranking, start=1):
-            if label in label_to_model:
-                model_name = label_to_model[label]
-                model_positions[model_name].append(position)
+            model_name = label_to_model.get(label)
+            if model_name is not None:
+                entry = totals.setdefault(model_name, [0, 0])
+                entry[0] += position
+                entry[1] += 1
 
     # Calculate average position for each model
-    aggregate = []
-    for model, positions in model_positions.items():
-        if positions:
-            avg_rank = sum(positions) / len(positions)
-            aggregate.append({
-                "model": model,
-                "average_rank": round(avg_rank, 2),
-                "rankings_count": len(positions)
-            })
+    aggregate = [
+        {
+            "model": model,
+            "average_rank": round(total / count, 2),
+            "rankings_count": count
+        }
+        for model, (total, count) in totals.items()
+    ]
 
     # Sort by average rank (lower is better)
     aggregate.sort(key=lambda x: x['average_rank'])
@@ -491,6 +722,55 @@ def calculate_aggregate_rankings(
     return aggregate
 
 
+async def check_stage1_consensus(
+    stage1_results: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Check whether the stage-1 answers agree closely enough to skip stages 2 and 3.
+
+    Embeds every response and compares all pairs by cosine similarity against
+    COUNCIL_SKIP_THRESHOLD.
+
+    Args:
+        stage1_results: Individual model responses from Stage 1
+
+    Returns:
+        Stage-3 style dict built from the longest response, or None to run the full council
+    """
+    if not _SKIP_THRESHOLD or len(stage1_results) < 2:
+        return None
+
+    threshold = float(_SKIP_THRESHOLD)
+    texts = [result['response'] or '' for result in stage1_results]
+
+    try:
+        # get_embeddings() is resolved in the worker too: the first call loads the model
+        vectors = await asyncio.to_thread(lambda: get_embeddings().embed_documents(texts))
+    except Exception as e:
+        print(f"Consensus check failed: {e}")
+        return None
+
+    # Normalize, then the smallest pairwise dot product is the weakest agreement
+    unit_vectors = []
+    for vector in vectors:
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm == 0:
+            return None
+        unit_vectors.append([x / norm for x in vector])
+
+    for i in range(len(unit_vectors)):
+        for j in range(i + 1, len(unit_vectors)):
+            similarity = sum(a * b for a, b in zip(unit_vectors[i], unit_vectors[j]))
+            if similarity < threshold:
+                return None
+
+    best = max(stage1_results, key=lambda result: len(result['response'] or ''))
+    return {
+        "model": best['model'],
+        "response": best['response']
+    }
+
+
 async def generate_conversation_title(user_query: str) -> str:
     """
     Generate a short title for a conversation based on the first user message.
@@ -533,14 +813,50 @@ async def run_full_council(user_query: str, conversation_id: Optional[str] = Non
     """
     Run the complete 3-stage council process.
 
+    Identical (user_query, conversation_id) calls that arrive while a run is in
+    flight, or within COUNCIL_DEDUP_WINDOW seconds after it finished, share its
+    result instead of starting a new run (e.g. retry/refresh clicks).
+
     Args:
         user_query: The user's question
 
     Returns:
         Tuple of (stage1_results, stage2_results, stage3_result, metadata)
     """
+    key = (user_query, conversation_id)
+    task = _INFLIGHT.get(key)
+    if task is None:
+        # The run gets its own task so no single caller owns it: cancelling any
+        # caller (including the first) only stops that caller's wait
+        task = asyncio.ensure_future(_run_full_council(user_query, conversation_id))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda done: _on_council_done(key, done))
+
+    return await asyncio.shield(task)
+
+
+def _on_council_done(key: Tuple[str, Optional[str]], task: "asyncio.Task") -> None:
+    """Keep a successful run reusable for the dedup window; forget failures now."""
+    if task.cancelled() or task.exception() is not None:
+        _forget_inflight(key, task)
+        return
+    asyncio.get_running_loop().call_later(_DEDUP_WINDOW, _forget_inflight, key, task)
+
+
+def _forget_inflight(key: Tuple[str, Optional[str]], task: "asyncio.Task") -> None:
+    """Drop a finished run from the dedup table unless it was already replaced."""
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+
+
+async def _run_full_council(user_query: str, conversation_id: Optional[str] = None) -> Tuple[List, List, Dict, Dict]:
+    """Run the 3-stage council process without request coalescing."""
+    # One memory view for the whole request (context lookup + final save); built
+    # in a worker thread because the first one loads the embedding model and Chroma
+    memory = await asyncio.to_thread(CouncilMemorySystem, conversation_id) if conversation_id else None
+
     # Stage 1: Collect individual responses (+ tool outputs)
-    stage1_results, tool_outputs = await stage1_collect_responses(user_query, conversation_id=conversation_id)
+    stage1_results, tool_outputs = await stage1_collect_responses(user_query, memory=memory)
 
     # If no models responded successfully, return error
     if not stage1_results:
@@ -549,34 +865,50 @@ async def run_full_council(user_query: str, conversation_id: Optional[str] = Non
             "response": "All models failed to respond. Please try again."
         }, {}
 
-    # Stage 2: Collect rankings
-    stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results)
-
-    # Calculate aggregate rankings
-    aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
-
-    # Stage 3: Synthesize final answer
-    stage3_result = await stage3_synthesize_final(
-        user_query,
-        stage1_results,
-        stage2_results,
-        tool_outputs=tool_outputs
-    )
+    # Skip review and synthesis when the council already agrees
+    consensus_result = await check_stage1_consensus(stage1_results)
+    stage1_toon = stage2_toon = None
+    if consensus_result is not None:
+        stage2_results, label_to_model, aggregate_rankings = [], {}, []
+        stage3_result = consensus_result
+    else:
+        # Stage 2: Collect rankings
+        stage2_results, label_to_model = await stage2_collect_rankings(user_query, stage1_results)
+
+        # Calculate aggregate rankings
+        aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
+
+        # Encode once; shared by the chairman prompt and the token-savings metric
+        stage1_toon, stage2_toon = await encode_stage_results_async(stage1_results, stage2_results)
+
+        # Stage 3: Synthesize final answer
+        stage3_result = await stage3_synthesize_final(
+            user_query,
+            stage1_results,
+            stage2_results,
+            tool_outputs=tool_outputs,
+            stage1_toon=stage1_toon,
+            stage2_toon=stage2_toon
+        )
 
-    # Save exchange to memory
-    if conversation_id:
-        memory = CouncilMemorySystem(conversation_id)
-        memory.save_exchange(user_query, stage3_result.get("response", ""))
+    # Save exchange to memory in the background (embedding + Chroma write)
+    if memory is not None:
+        _spawn_background(asyncio.to_thread(
+            memory.save_exchange, user_query, stage3_result.get("response", "")
+        ))
 
     # Calculate token savings from TOON
-    token_savings = calculate_token_savings(stage1_results, stage2_results)
+    token_savings = calculate_token_savings(
+        stage1_results, stage2_results, stage1_toon=stage1_toon, stage2_toon=stage2_toon
+    )
 
     # Prepare metadata
     metadata = {
         "label_to_model": label_to_model,
         "aggregate_rankings": aggregate_rankings,
         "token_savings": token_savings,
-        "tool_outputs": tool_outputs
+        "tool_outputs": tool_outputs,
+        "consensus": consensus_result is not None
     }
 
     return stage1_results, stage2_results, stage3_result, metadata
@@ -584,7 +916,9 @@ async def run_full_council(user_query: str, conversation_id: Optional[str] = Non
 
 def calculate_token_savings(
     stage1_results: List[Dict[str, Any]],
-    stage2_results: List[Dict[str, Any]]
+    stage2_results: List[Dict[str, Any]],
+    stage1_toon: Optional[str] = None,
+    stage2_toon: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Calculate token savings from using TOON format.
@@ -592,22 +926,27 @@ def calculate_token_savings(
     Args:
         stage1_results: Stage 1 responses
         stage2_results: Stage 2 rankings
+        stage1_toon: Pre-encoded TOON for stage1_results (encoded here if omitted)
+        stage2_toon: Pre-encoded TOON for stage2_results (encoded here if omitted)
 
     Returns:
-        Dict with token counts and savings
+        Dict with token counts and savings (empty when measurement is disabled)
     """
-    try:
-        import tiktoken
+    # Two serializations plus two tokenizer passes; skip unless wanted
+    if os.getenv("COUNCIL_MEASURE_TOKENS", "true").lower() != "true":
+        return {}
 
-        enc = tiktoken.get_encoding("cl100k_base")
+    try:
+        enc = _get_encoder()
 
         # Calculate tokens for JSON format
         json_str = json.dumps({"stage1": stage1_results, "stage2": stage2_results})
         json_tokens = len(enc.encode(json_str))
 
-        # Calculate tokens for TOON format
-        toon_str = toon.encode({"stage1": stage1_results, "stage2": stage2_results})
-        toon_tokens = len(enc.encode(toon_str))
+        # Calculate tokens for TOON format (the same encoding the chairman sees)
+        if stage1_toon is None or stage2_toon is None:
+            stage1_toon, stage2_toon = encode_stage_results(stage1_results, stage2_results)
+        toon_tokens = len(enc.encode(stage1_toon)) + len(enc.encode(stage2_toon))
 
         saved = json_tokens - toon_tokens
         percent = (saved / json_tokens * 100) if json_tokens > 0 else 0
@@ -1,6 +1,6 @@
 """FastAPI backend for LLM Council."""
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -10,8 +10,11 @@ import json
 import asyncio
 
 from . import storage
-from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage2_collect_rankings, stage3_synthesize_final, calculate_aggregate_rankings
+from .council import run_full_council, generate_conversation_title, stage1_collect_responses, stage2_collect_rankings, calculate_aggregate_rankings, check_stage1_consensus, encode_stage_results_async, stage3_synthesize_final_stream, drain_background_tasks
+from .config import CHAIRMAN_MODEL
 from .database import init_database
+from .memory import CouncilMemorySystem
+from .openrouter import close_client
 
 app = FastAPI(title="LLM Council API")
 
@@ -21,6 +24,13 @@ async def startup_event():
     """Initialize database tables if using database storage."""
     init_database()
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Finish background memory writes and release pooled OpenRouter connections."""
+    await drain_background_tasks()
+    await close_client()
+
 # Enable CORS for local development
 app.add_middleware(
     CORSMiddleware,
@@ -44,6 +54,7 @@ class CreateConversationRequest(BaseModel):
 class SendMessageRequest(BaseModel):
     """Request to send a message in a conversation."""
     content: str
+    # History for temporary chats only; saved conversations use their stored messages
     context: Optional[List[Dict[str, Any]]] = None
     temporary: Optional[bool] = False  # If True, don't save to storage
 
@@ -53,6 +64,11 @@ class UpdateTitleRequest(BaseModel):
     title: str
 
 
+class BulkDeleteRequest(BaseModel):
+    """Request to delete several conversations."""
+    ids: List[str]
+
+
 class ConversationMetadata(BaseModel):
     """Conversation metadata for list view."""
     id: str
@@ -76,23 +92,41 @@ async def root():
 
 
 @app.get("/api/conversations", response_model=List[ConversationMetadata])
-async def list_conversations():
-    """List all conversations (metadata only)."""
-    return storage.list_conversations()
+async def list_conversations(
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None
+):
+    """
+    List conversations (metadata only), newest first.
+
+    Paginate with `limit`; pass `cursor` as "<created_at>|<id>" of the last
+    conversation on the previous page to fetch the next one.
+    """
+    parsed_cursor = None
+    if cursor:
+        created_at, sep, conversation_id = cursor.partition("|")
+        if not sep or not created_at or not conversation_id:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        parsed_cursor = (created_at, conversation_id)
+
+    try:
+        return await storage.list_conversations(limit=limit, cursor=parsed_cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @app.post("/api/conversations", response_model=Conversation)
 async def create_conversation(request: CreateConversationRequest):
     """Create a new conversation."""
     conversation_id = str(uuid.uuid4())
-    conversation = storage.create_conversation(conversation_id)
+    conversation = await storage.create_conversation(conversation_id)
     return conversation
 
 
 @app.get("/api/conversations/{conversation_id}", response_model=Conversation)
 async def get_conversation(conversation_id: str):
     """Get a specific conversation with all its messages."""
-    conversation = storage.get_conversation(conversation_id)
+    conversation = await storage.get_conversation(conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return conversation
@@ -105,14 +139,12 @@ async def update_conversation_title(conversation_id: str, request: UpdateTitleRe
 
     Works with all storage backends: JSON, PostgreSQL, MySQL.
     """
-    # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
-    if conversation is None:
+    # Update title (raises ValueError if the conversation does not exist)
+    try:
+        await storage.update_conversation_title(conversation_id, request.title)
+    except ValueError:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Update title
-    storage.update_conversation_title(conversation_id, request.title)
-
     return {
         "success": True,
         "message": "Title updated",
@@ -127,12 +159,24 @@ async def delete_conversation(conversation_id: str):
 
     Works with all storage backends: JSON, PostgreSQL, MySQL.
     """
-    success = storage.delete_conversation(conversation_id)
+    success = await storage.delete_conversation(conversation_id)
     if not success:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return {"success": True, "message": "Conversation deleted"}
 
 
+@app.post("/api/conversations/bulk-delete")
+async def delete_conversations(request: BulkDeleteRequest):
+    """
+    Delete several conversations in one request.
+
+    Works with all storage backends: JSON, PostgreSQL, MySQL.
+    IDs that do not exist are skipped.
+    """
+    deleted = await storage.delete_conversations(request.ids)
+    return {"success": True, "deleted": deleted}
+
+
 @app.post("/api/conversations/{conversation_id}/message")
 async def send_message(conversation_id: str, request: SendMessageRequest):
     """
@@ -160,7 +204,7 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
 
     # Normal mode: save to storage
     # Check if conversation exists
-    conversation = storage.get_conversation(conversation_id)
+    conversation = await storage.get_conversation(conversation_id)
     if conversation is None:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -168,12 +212,12 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     is_first_message = len(conversation["messages"]) == 0
 
     # Add user message
-    storage.add_user_message(conversation_id, request.content)
+    await storage.add_user_message(conversation_id, request.content)
 
     # If this is the first message, generate a title
     if is_first_message:
         title = await generate_conversation_title(request.content)
-        storage.update_conversation_title(conversation_id, title)
+        await storage.update_conversation_title(conversation_id, title)
 
     # Run the 3-stage council process
     stage1_results, stage2_results, stage3_result, metadata = await run_full_council(
@@ -182,7 +226,7 @@ async def send_message(conversation_id: str, request: SendMessageRequest):
     )
 
     # Add assistant message with all stages
-    storage.add_assistant_message(
+    await storage.add_assistant_message(
         conversation_id,
         stage1_results,
         stage2_results,
@@ -210,18 +254,22 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     # For temporary mode, skip conversation check
     if not request.temporary:
         # Check if conversation exists (normal mode only)
-        conversation = storage.get_conversation(conversation_id)
+        conversation = await storage.get_conversation(conversation_id)
         if conversation is None:
             raise HTTPException(status_code=404, detail="Conversation not found")
         is_first_message = len(conversation["messages"]) == 0
+        # Full stored history: stage 1 aligns its prompt-cache boundary on
+        # absolute message positions, which a client-side tail would lose
+        history = list(conversation["messages"])
     else:
         is_first_message = False  # No title generation for temporary chats
+        history = request.context
 
     async def event_generator():
         try:
             # Add user message (skip for temporary mode)
             if not request.temporary:
-                storage.add_user_message(conversation_id, request.content)
+                await storage.add_user_message(conversation_id, request.content)
 
                 # Start title generation in parallel (don't await yet)
                 title_task = None
@@ -235,17 +283,26 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
 
             # Stage 1: Collect responses (with context)
             yield f"data: {json.dumps({'type': 'stage1_start'})}\n\n"
+            # Built in a worker thread: the first one loads the embedding model and Chroma
+            memory = None if request.temporary else await asyncio.to_thread(CouncilMemorySystem, conversation_id)
             stage1_results, tool_outputs = await stage1_collect_responses(
                 request.content,
-                context=request.context,
-                conversation_id=None if request.temporary else conversation_id
+                context=history,
+                memory=memory
             )
             msg_metadata["tool_outputs"] = tool_outputs
             yield f"data: {json.dumps({'type': 'stage1_complete', 'data': stage1_results, 'metadata': {'tool_outputs': tool_outputs}})}\n\n"
 
+            # Skip review and synthesis when the council already agrees
+            consensus_result = await check_stage1_consensus(stage1_results)
+            msg_metadata["consensus"] = consensus_result is not None
+
             # Stage 2: Collect rankings
             yield f"data: {json.dumps({'type': 'stage2_start'})}\n\n"
-            stage2_results, label_to_model = await stage2_collect_rankings(request.content, stage1_results)
+            if consensus_result is not None:
+                stage2_results, label_to_model = [], {}
+            else:
+                stage2_results, label_to_model = await stage2_collect_rankings(request.content, stage1_results)
             aggregate_rankings = calculate_aggregate_rankings(stage2_results, label_to_model)
             msg_metadata["label_to_model"] = label_to_model
             msg_metadata["aggregate_rankings"] = aggregate_rankings
@@ -253,16 +310,45 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
 
             # Stage 3: Synthesize final answer
             yield f"data: {json.dumps({'type': 'stage3_start'})}\n\n"
-            stage3_result = await stage3_synthesize_final(
-                request.content,
-                stage1_results,
-                stage2_results,
-                tool_outputs=tool_outputs
-            )
+            stage1_toon = stage2_toon = None
+            if consensus_result is not None:
+                stage3_result = consensus_result
+            else:
+                stage1_toon, stage2_toon = await encode_stage_results_async(stage1_results, stage2_results)
+
+                # Forward the chairman's answer as it is generated
+                chunks = []
+                stream_failed = False
+                try:
+                    async for delta in stage3_synthesize_final_stream(
+                        request.content,
+                        stage1_results,
+                        stage2_results,
+                        tool_outputs=tool_outputs,
+                        stage1_toon=stage1_toon,
+                        stage2_toon=stage2_toon
+                    ):
+                        chunks.append(delta)
+                        yield f"data: {json.dumps({'type': 'stage3_delta', 'data': {'model': CHAIRMAN_MODEL, 'delta': delta}})}\n\n"
+                except Exception:
+                    stream_failed = True
+
+                response_text = "".join(chunks)
+                if not response_text:
+                    response_text = "Error: Unable to generate final synthesis."
+                elif stream_failed:
+                    # Keep what arrived, but never present a cut-off answer as complete
+                    response_text += "\n\n*[Error: the final synthesis was interrupted and is incomplete.]*"
+
+                stage3_result = {"model": CHAIRMAN_MODEL, "response": response_text}
+                if stream_failed and chunks:
+                    stage3_result["truncated"] = True
 
             # Calculate token savings
             from .council import calculate_token_savings
-            token_savings = calculate_token_savings(stage1_results, stage2_results)
+            token_savings = calculate_token_savings(
+                stage1_results, stage2_results, stage1_toon=stage1_toon, stage2_toon=stage2_toon
+            )
 
             msg_metadata["token_savings"] = token_savings
 
@@ -271,12 +357,12 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
             # Wait for title generation if it was started (normal mode only)
             if title_task:
                 title = await title_task
-                storage.update_conversation_title(conversation_id, title)
+                await storage.update_conversation_title(conversation_id, title)
                 yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
 
             # Save complete assistant message (skip for temporary mode)
             if not request.temporary:
-                storage.add_assistant_message(
+                await storage.add_assistant_message(
                     conversation_id,
                     stage1_results,
                     stage2_results,
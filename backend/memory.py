@@ -1,21 +1,51 @@
 """Conversation memory with optional embeddings backend.
 
 Defaults to free local sentence-transformers; can switch to OpenAI embeddings
-when ENABLE_OPENAI_EMBEDDINGS=true and OPENAI_API_KEY is set.
+when ENABLE_OPENAI_EMBEDDINGS=true and OPENAI_API_KEY is set, or to the
+int8-quantized ONNX export of the local model when ENABLE_ONNX_EMBEDDINGS=true.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from typing import Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from pathlib import Path
 
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_community.vectorstores import Chroma
+# langchain_community is imported on first use; it adds seconds to cold start
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import Chroma
+
+LOCAL_EMBEDDINGS_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Process-wide singletons; loading the embedding model and opening Chroma are
+# far too expensive to repeat per request
+_embeddings = None
+_memory_store: Optional[Chroma] = None
+# Accessors are called from worker threads; without a lock two first calls
+# would each load the model. One lock per singleton, as the memory store
+# initializer resolves the embeddings while holding its own.
+_EMBEDDINGS_LOCK = threading.Lock()
+_MEMORY_STORE_LOCK = threading.Lock()
+_RESPONSE_CACHE_LOCK = threading.Lock()
 
 
 def get_embeddings():
-    """Return embeddings implementation based on env flags."""
+    """Return the embeddings implementation based on env flags (loaded once)."""
+    global _embeddings
+    if _embeddings is None:
+        with _EMBEDDINGS_LOCK:
+            if _embeddings is None:
+                _embeddings = _create_embeddings()
+    return _embeddings
+
+
+def _create_embeddings():
+    """Build a new embeddings implementation based on env flags."""
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
     if os.getenv("ENABLE_OPENAI_EMBEDDINGS", "false").lower() == "true":
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
@@ -27,12 +57,46 @@ def get_embeddings():
                 # Fall back to local embeddings on failure
                 pass
 
+    # Optional: quantized ONNX export of the same model (needs sentence-transformers[onnx])
+    if os.getenv("ENABLE_ONNX_EMBEDDINGS", "false").lower() == "true":
+        try:
+            return HuggingFaceEmbeddings(
+                model_name=LOCAL_EMBEDDINGS_MODEL,
+                model_kwargs={
+                    "backend": "onnx",
+                    "model_kwargs": {
+                        "file_name": os.getenv("ONNX_EMBEDDINGS_FILE", "onnx/model_quint8_avx2.onnx")
+                    },
+                },
+            )
+        except Exception:
+            # Fall back to the PyTorch backend when onnxruntime/optimum are missing
+            pass
+
     # Free local embeddings
-    return HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    return HuggingFaceEmbeddings(model_name=LOCAL_EMBEDDINGS_MODEL)
+
+
+def _get_memory_store() -> Chroma:
+    """Return the shared memory collection; conversations are told apart by metadata."""
+    global _memory_store
+    if _memory_store is None:
+        with _MEMORY_STORE_LOCK:
+            if _memory_store is None:
+                from langchain_community.vectorstores import Chroma
+
+                store_path = Path("./data/memory")
+                store_path.mkdir(parents=True, exist_ok=True)
+                _memory_store = Chroma(
+                    collection_name="council_memory",
+                    embedding_function=get_embeddings(),
+                    persist_directory=str(store_path),
+                )
+    return _memory_store
 
 
 class CouncilMemorySystem:
-    """Lightweight per-conversation memory backed by Chroma."""
+    """Lightweight per-conversation view over the shared Chroma memory store."""
 
     def __init__(self, conversation_id: str):
         self.enabled = os.getenv("ENABLE_MEMORY", "true").lower() == "true"
@@ -43,16 +107,10 @@ class CouncilMemorySystem:
         if not self.enabled:
             return
 
-        embeddings = get_embeddings()
-        store_path = Path("./data/memory") / conversation_id
-        store_path.mkdir(parents=True, exist_ok=True)
-
-        self.vectorstore = Chroma(
-            collection_name=f"conv_{conversation_id}",
-            embedding_function=embeddings,
-            persist_directory=str(store_path),
+        self.vectorstore = _get_memory_store()
+        self.retriever = self.vectorstore.as_retriever(
+            search_kwargs={"k": 3, "filter": {"conversation_id": conversation_id}}
         )
-        self.retriever = self.vectorstore.as_retriever(search_kwargs={"k": 3})
 
     def get_context(self, query: str) -> str:
         """Retrieve relevant context for a query."""
@@ -72,6 +130,133 @@ class CouncilMemorySystem:
             return
         try:
             content = f"User: {user_msg}\nAssistant: {assistant_msg}"
-            self.vectorstore.add_texts([content])
+            self.vectorstore.add_texts(
+                [content], metadatas=[{"conversation_id": self.conversation_id}]
+            )
         except Exception:
             return
+
+
+class SemanticResponseCache:
+    """Embedding-keyed cache of stage-1 model responses backed by Chroma.
+
+    Entries are keyed on (model, normalized query, context hash). A lookup hits
+    when the cosine similarity between the query embedding and a cached query
+    for the same model and context is at least ``threshold``.
+    """
+
+    def __init__(self, threshold: Optional[float] = None):
+        self.enabled = os.getenv("ENABLE_RESPONSE_CACHE", "false").lower() == "true"
+        self.threshold = (
+            threshold
+            if threshold is not None
+            else float(os.getenv("RESPONSE_CACHE_THRESHOLD", "0.92"))
+        )
+        self.embeddings = None
+        self.vectorstore = None
+
+        if not self.enabled:
+            return
+
+        from langchain_community.vectorstores import Chroma
+
+        self.embeddings = get_embeddings()
+        store_path = Path("./data/cache")
+        store_path.mkdir(parents=True, exist_ok=True)
+
+        self.vectorstore = Chroma(
+            collection_name="llm_response_cache",
+            embedding_function=self.embeddings,
+            persist_directory=str(store_path),
+            collection_metadata={"hnsw:space": "cosine"},
+        )
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Lowercase and collapse whitespace so trivial variations share a key."""
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def context_hash(messages: List[Dict[str, Any]]) -> str:
+        """Hash the context messages that precede the user query."""
+        payload = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def embed(self, query: str) -> Optional[List[float]]:
+        """Embed a query once so it can be reused for every model lookup."""
+        if not self.enabled or self.embeddings is None:
+            return None
+        try:
+            return self.embeddings.embed_query(self.normalize_query(query))
+        except Exception:
+            return None
+
+    def lookup(self, embedding: List[float], model: str, context_hash: str) -> Optional[str]:
+        """Return a cached response for this model/context, or None on a miss."""
+        if not self.enabled or self.vectorstore is None or embedding is None:
+            return None
+        try:
+            results = self.vectorstore.similarity_search_by_vector_with_relevance_scores(
+                embedding,
+                k=1,
+                filter={"$and": [{"model": model}, {"context_hash": context_hash}]},
+            )
+        except Exception:
+            return None
+
+        if not results:
+            return None
+
+        doc, distance = results[0]
+        # Chroma reports cosine distance; convert to similarity for the threshold
+        if 1.0 - distance < self.threshold:
+            return None
+        return doc.metadata.get("response")
+
+    def store(
+        self,
+        query: str,
+        context_hash: str,
+        responses: Dict[str, str],
+        embedding: Optional[List[float]] = None,
+    ):
+        """Persist fresh (model, query, response) entries.
+
+        Pass the embedding already computed by ``embed`` to avoid re-embedding
+        the query once per model. Entries are upserted under an ID derived
+        from (model, context, query), so repeats replace rather than pile up.
+        """
+        if not self.enabled or self.vectorstore is None or not responses:
+            return
+        try:
+            normalized = self.normalize_query(query)
+            if embedding is None:
+                embedding = self.embeddings.embed_query(normalized)
+            models = list(responses)
+            self.vectorstore._collection.upsert(
+                ids=[
+                    hashlib.sha256(f"{model}\0{context_hash}\0{normalized}".encode("utf-8")).hexdigest()
+                    for model in models
+                ],
+                embeddings=[embedding] * len(models),
+                documents=[normalized] * len(models),
+                metadatas=[
+                    {"model": model, "context_hash": context_hash, "response": responses[model]}
+                    for model in models
+                ],
+            )
+        except Exception:
+            return
+
+
+_response_cache: Optional[SemanticResponseCache] = None
+
+
+def get_response_cache() -> SemanticResponseCache:
+    """Return the process-wide stage-1 response cache."""
+    global _response_cache
+    if _response_cache is None:
+        with _RESPONSE_CACHE_LOCK:
+            if _response_cache is None:
+                _response_cache = SemanticResponseCache()
+    return _response_cache
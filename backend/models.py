@@ -1,6 +1,7 @@
 """SQLAlchemy models for PostgreSQL and MySQL."""
 
-from sqlalchemy import Column, String, Text, DateTime, JSON, Index
+from sqlalchemy import Column, String, Text, DateTime, Integer, JSON, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from .database import Base
 
@@ -25,12 +26,22 @@ class Conversation(Base):
     # Messages stored as JSON
     # PostgreSQL: Uses native JSONB (faster)
     # MySQL: Uses JSON type (MySQL 5.7.8+)
-    messages = Column(JSON, nullable=False, default=list)
+    messages = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=list)
+
+    # Maintained on every write so listing never measures the JSON array
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Indexes for performance
     __table_args__ = (
         Index("idx_created_at", "created_at"),
         Index("idx_title", "title"),
+        # Keyset pagination order; on PostgreSQL also covers the list columns
+        Index(
+            "idx_conversations_list",
+            "created_at",
+            "id",
+            postgresql_include=["title", "message_count"],
+        ),
     )
 
     def to_dict(self):
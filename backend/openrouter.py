@@ -1,9 +1,61 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
+import json
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
 
+# Providers that need explicit cache_control breakpoints for prompt caching
+# (OpenAI, Grok, DeepSeek etc. cache matching prefixes automatically)
+_CACHE_CONTROL_PREFIXES = ("anthropic/", "google/")
+
+# Shared client so concurrent model calls multiplex over pooled HTTP/2 connections
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(60.0),
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared AsyncClient (call on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _prepare_messages(model: str, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Strip internal message flags and add prompt-cache breakpoints.
+
+    Messages flagged with 'cacheable' form a stable prefix across turns; for
+    providers that support it, their content is marked as an ephemeral cache
+    breakpoint so the provider can reuse the prefix computation.
+    """
+    use_cache_control = model.startswith(_CACHE_CONTROL_PREFIXES)
+    prepared = []
+    for message in messages:
+        cacheable = message.get("cacheable", False)
+        message = {k: v for k, v in message.items() if k != "cacheable"}
+        if cacheable and use_cache_control and isinstance(message.get("content"), str):
+            message["content"] = [{
+                "type": "text",
+                "text": message["content"],
+                "cache_control": {"type": "ephemeral"},
+            }]
+        prepared.append(message)
+    return prepared
+
 
 async def query_model(
     model: str,
@@ -28,35 +80,97 @@ async def query_model(
 
     payload = {
         "model": model,
-        "messages": messages,
+        "messages": _prepare_messages(model, messages),
     }
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            message = data['choices'][0]['message']
-
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details')
-            }
+        response = await get_client().post(
+            OPENROUTER_API_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        message = data['choices'][0]['message']
+
+        return {
+            'content': message.get('content'),
+            'reasoning_details': message.get('reasoning_details')
+        }
 
     except Exception as e:
         print(f"Error querying model {model}: {e}")
         return None
 
 
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, str]],
+    timeout: float = 120.0
+) -> AsyncIterator[str]:
+    """
+    Query a single model via OpenRouter API, streaming the answer.
+
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content'
+        timeout: Request timeout in seconds
+
+    Yields:
+        Content deltas as they arrive
+
+    Raises:
+        Exception: Any request or parse failure, after logging it, so callers
+            can tell a complete answer from one cut off midway
+    """
+    headers = {
+        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Content-Type": "application/json",
+    }
+
+    payload = {
+        "model": model,
+        "messages": _prepare_messages(model, messages),
+        "stream": True,
+    }
+
+    try:
+        async with get_client().stream(
+            "POST",
+            OPENROUTER_API_URL,
+            headers=headers,
+            json=payload,
+            timeout=timeout
+        ) as response:
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                # SSE data lines; OpenRouter also sends ": OPENROUTER PROCESSING" comments
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+
+                chunk = json.loads(data)
+                choices = chunk.get('choices') or []
+                if not choices:
+                    continue
+                delta = choices[0].get('delta', {}).get('content')
+                if delta:
+                    yield delta
+
+    except Exception as e:
+        print(f"Error streaming model {model}: {e}")
+        raise
+
+
 async def query_models_parallel(
     models: List[str],
     messages: List[Dict[str, str]]
-) -> Dict[str, Optional[Dict[str, Any]]]:
+) -> List[Tuple[str, Dict[str, Any]]]:
     """
     Query multiple models in parallel.
 
@@ -65,15 +179,61 @@ async def query_models_parallel(
         messages: List of message dicts to send to each model
 
     Returns:
-        Dict mapping model identifier to response dict (or None if failed)
+        List of (model, response) tuples for successful models, in input order
     """
-    import asyncio
-
     # Create tasks for all models
     tasks = [query_model(model, messages) for model in models]
 
-    # Wait for all to complete
-    responses = await asyncio.gather(*tasks)
+    # Wait for all to complete; a failing task must not cancel its siblings
+    responses = await asyncio.gather(*tasks, return_exceptions=True)
 
-    # Map models to their responses
-    return {model: response for model, response in zip(models, responses)}
+    # Keep only successful responses
+    return [
+        (model, response)
+        for model, response in zip(models, responses)
+        if response is not None and not isinstance(response, BaseException)
+    ]
+
+
+async def query_models_as_completed(
+    models: List[str],
+    messages: List[Dict[str, str]],
+    straggler_timeout: Optional[float] = None
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Query multiple models in parallel, yielding each response as it lands.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+        straggler_timeout: Once the first successful response arrives, wait at
+            most this many seconds for the rest; unfinished calls are cancelled
+
+    Yields:
+        (model, response) tuples for successful models, in completion order
+    """
+    loop = asyncio.get_running_loop()
+    tasks = {asyncio.create_task(query_model(model, messages)): model for model in models}
+    pending = set(tasks)
+    deadline = None
+
+    try:
+        while pending:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            done, pending = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                # Straggler deadline expired
+                break
+            for task in done:
+                response = task.result()
+                if response is None:
+                    continue
+                if deadline is None and straggler_timeout is not None:
+                    deadline = loop.time() + straggler_timeout
+                yield tasks[task], response
+    finally:
+        for task in pending:
+            print(f"Dropping straggler model {tasks[task]}")
+            task.cancel()
@@ -6,15 +6,28 @@ Based on DATABASE_TYPE environment variable:
 - "json" (default): Use JSON file storage (backward compatible)
 """
 
+import asyncio
 import json
 import os
+import threading
+import weakref
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
+import ijson
+from cachetools import TTLCache
+from sqlalchemy import bindparam, select, text, tuple_, update
 from .config import DATA_DIR
-from .database import get_storage_type, is_using_database, SessionLocal
+from .database import get_storage_type, is_using_database, session_scope
 from .models import Conversation as ConversationModel
 
+# Optional: orjson encodes/decodes conversation files in C; stdlib json otherwise
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 # ==================== JSON FILE STORAGE (Original) ====================
 
@@ -23,6 +36,85 @@ def ensure_data_dir():
     Path(DATA_DIR).mkdir(parents=True, exist_ok=True)
 
 
+# Conversation files are written compact unless pretty output is requested
+DEBUG_JSON_PRETTY = os.getenv("DEBUG_JSON_PRETTY", "false").lower() == "true"
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize a conversation file body."""
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if DEBUG_JSON_PRETTY:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if DEBUG_JSON_PRETTY:
+        return json.dumps(data, indent=2).encode('utf-8') + b"\n"
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b"\n"
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse a conversation file body."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Directory handle reused to make renames durable without reopening DATA_DIR
+_DATA_DIR_FD: Optional[int] = None
+_DATA_DIR_FD_LOCK = threading.Lock()
+
+
+def _data_dir_fd() -> int:
+    """Return the process-wide descriptor for DATA_DIR, opening it once."""
+    global _DATA_DIR_FD
+    with _DATA_DIR_FD_LOCK:
+        if _DATA_DIR_FD is None:
+            _DATA_DIR_FD = os.open(DATA_DIR, os.O_RDONLY)
+        return _DATA_DIR_FD
+
+
+def _fsync_data_dir():
+    """Flush directory entries (renames) in DATA_DIR to disk."""
+    if os.name == "nt":
+        return  # Directories cannot be fsynced on Windows
+    os.fsync(_data_dir_fd())
+
+
+def _write_json_atomic(path: str, data: Any):
+    """
+    Write a conversation file so readers never see a partial file.
+
+    The body goes to a temp file in the same directory which is fsynced
+    and then renamed over the destination.
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable value
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dump_json(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _fsync_data_dir()
+
+
+def _is_safe_conversation_id(conversation_id: str) -> bool:
+    """Check that an ID names a file inside DATA_DIR (no separators or '..')."""
+    if not conversation_id or conversation_id in (".", "..") or "\0" in conversation_id:
+        return False
+    return not any(
+        sep and sep in conversation_id
+        for sep in (os.sep, os.altsep)
+    )
+
+
 def get_conversation_path(conversation_id: str) -> str:
     """Get the file path for a conversation."""
     return os.path.join(DATA_DIR, f"{conversation_id}.json")
@@ -39,9 +131,7 @@ def _json_create_conversation(conversation_id: str) -> Dict[str, Any]:
         "messages": []
     }
 
-    path = get_conversation_path(conversation_id)
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
+    _write_json_atomic(get_conversation_path(conversation_id), conversation)
 
     return conversation
 
@@ -53,37 +143,87 @@ def _json_get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     if not os.path.exists(path):
         return None
 
-    with open(path, 'r') as f:
-        return json.load(f)
+    with open(path, 'rb') as f:
+        return _load_json(f.read())
 
 
 def _json_save_conversation(conversation: Dict[str, Any]):
     """Save conversation to JSON file."""
     ensure_data_dir()
 
-    path = get_conversation_path(conversation['id'])
-    with open(path, 'w') as f:
-        json.dump(conversation, f, indent=2)
+    _write_json_atomic(get_conversation_path(conversation['id']), conversation)
+
+
+# List metadata per conversation file: path -> (mtime_ns, size, header).
+# Unchanged files are served from here without being reopened.
+_LIST_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _read_conversation_header(path: str) -> Dict[str, Any]:
+    """
+    Read the list metadata of a conversation file.
+
+    The file is tokenized incrementally with ijson: messages are counted
+    without being materialized, so memory stays constant however long the
+    conversation is.
+
+    Args:
+        path: Path to the conversation JSON file
+
+    Returns:
+        Dict with id, created_at, title and message_count
+    """
+    header = {"title": "New Conversation", "message_count": 0}
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in ("id", "created_at", "title") and event == "string":
+                header[prefix] = value
+            elif prefix == "messages.item" and event == "start_map":
+                header["message_count"] += 1
+            elif prefix == "messages" and event == "end_array":
+                if "id" in header and "created_at" in header:
+                    break
+    return {
+        "id": header["id"],
+        "created_at": header["created_at"],
+        "title": header["title"],
+        "message_count": header["message_count"]
+    }
 
 
-def _json_list_conversations() -> List[Dict[str, Any]]:
-    """List all conversations from JSON files."""
+def _json_list_conversations(
+    limit: Optional[int] = None,
+    cursor: Optional[Tuple[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """List conversations from JSON files, newest first."""
     ensure_data_dir()
 
     conversations = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith('.json'):
-            path = os.path.join(DATA_DIR, filename)
-            with open(path, 'r') as f:
-                data = json.load(f)
-                conversations.append({
-                    "id": data["id"],
-                    "created_at": data["created_at"],
-                    "title": data.get("title", "New Conversation"),
-                    "message_count": len(data["messages"])
-                })
-
-    conversations.sort(key=lambda x: x["created_at"], reverse=True)
+    seen = set()
+    with os.scandir(DATA_DIR) as entries:
+        for entry in entries:
+            if not (entry.name.endswith('.json') and entry.is_file()):
+                continue
+            stat = entry.stat()
+            cached = _LIST_CACHE.get(entry.path)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                header = cached[2]
+            else:
+                header = _read_conversation_header(entry.path)
+                _LIST_CACHE[entry.path] = (stat.st_mtime_ns, stat.st_size, header)
+            seen.add(entry.path)
+            conversations.append(header)
+
+    # Forget files that were deleted since the last listing
+    for path in _LIST_CACHE.keys() - seen:
+        _LIST_CACHE.pop(path, None)
+
+    conversations.sort(key=lambda x: (x["created_at"], x["id"]), reverse=True)
+
+    if cursor is not None:
+        conversations = [c for c in conversations if (c["created_at"], c["id"]) < cursor]
+    if limit is not None:
+        conversations = conversations[:limit]
     return conversations
 
 
@@ -98,82 +238,198 @@ def _json_delete_conversation(conversation_id: str) -> bool:
     return True
 
 
+def _json_delete_conversations(conversation_ids: List[str]) -> int:
+    """Delete several conversation files; returns how many existed."""
+    ensure_data_dir()
+
+    # unlinkat() relative to the held directory handle avoids a path
+    # lookup of DATA_DIR per file where the platform supports it
+    dir_fd = _data_dir_fd() if os.unlink in os.supports_dir_fd else None
+
+    deleted = 0
+    for conversation_id in conversation_ids:
+        # IDs come from a request body, not a path segment; never let one
+        # name a file outside DATA_DIR
+        if not _is_safe_conversation_id(conversation_id):
+            continue
+        try:
+            if dir_fd is not None:
+                os.unlink(f"{conversation_id}.json", dir_fd=dir_fd)
+            else:
+                os.remove(get_conversation_path(conversation_id))
+            deleted += 1
+        except FileNotFoundError:
+            pass
+    return deleted
+
+
 # ==================== DATABASE STORAGE (New) ====================
 
+# Statements built once at import; executions only bind parameters, so the
+# compiled SQL is reused from the engine cache without re-deriving cache keys
+_SELECT_CONVERSATION = select(
+    ConversationModel.id,
+    ConversationModel.created_at,
+    ConversationModel.updated_at,
+    ConversationModel.title,
+    ConversationModel.messages
+).where(ConversationModel.id == bindparam("conversation_id"))
+
+_UPDATE_CONVERSATION = (
+    update(ConversationModel)
+    .where(ConversationModel.id == bindparam("conversation_id"))
+    .values(
+        title=bindparam("title"),
+        messages=bindparam("messages", type_=ConversationModel.messages.type),
+        message_count=bindparam("message_count")
+    )
+)
+
+
 def _db_create_conversation(conversation_id: str) -> Dict[str, Any]:
     """Create conversation in database."""
-    db = SessionLocal()
-    try:
+    with session_scope() as db:
         conversation = ConversationModel(
             id=conversation_id,
             title="New Conversation",
-            messages=[]
+            messages=[],
+            message_count=0
         )
         db.add(conversation)
         db.commit()
         db.refresh(conversation)
         return conversation.to_dict()
-    finally:
-        db.close()
 
 
 def _db_get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     """Get conversation from database."""
-    db = SessionLocal()
-    try:
-        conversation = db.query(ConversationModel).filter(
-            ConversationModel.id == conversation_id
-        ).first()
+    with session_scope() as db:
+        row = db.execute(_SELECT_CONVERSATION, {"conversation_id": conversation_id}).first()
 
-        if conversation is None:
-            return None
+    if row is None:
+        return None
 
-        return conversation.to_dict()
-    finally:
-        db.close()
+    return {
+        "id": row.id,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        "title": row.title,
+        "messages": row.messages or [],
+    }
 
 
 def _db_save_conversation(conversation: Dict[str, Any]):
-    """Save conversation to database."""
-    db = SessionLocal()
-    try:
-        db_conversation = db.query(ConversationModel).filter(
-            ConversationModel.id == conversation['id']
-        ).first()
+    """Save conversation to database (single UPDATE, no prior SELECT)."""
+    with session_scope() as db:
+        db.execute(_UPDATE_CONVERSATION, {
+            "conversation_id": conversation['id'],
+            "title": conversation['title'],
+            "messages": conversation['messages'],
+            "message_count": len(conversation['messages'])
+        })
+        db.commit()
 
-        if db_conversation:
-            db_conversation.title = conversation['title']
-            db_conversation.messages = conversation['messages']
-            db.commit()
-    finally:
-        db.close()
 
+def _db_append_message(conversation_id: str, message: Dict[str, Any]):
+    """
+    Append one message in place, without reading or rewriting the history.
 
-def _db_list_conversations() -> List[Dict[str, Any]]:
-    """List all conversations from database."""
-    db = SessionLocal()
-    try:
-        conversations = db.query(ConversationModel).order_by(
-            ConversationModel.created_at.desc()
-        ).all()
-
-        return [
-            {
-                "id": c.id,
-                "created_at": c.created_at.isoformat(),
-                "title": c.title,
-                "message_count": len(c.messages or [])
-            }
-            for c in conversations
-        ]
-    finally:
-        db.close()
+    Raises:
+        ValueError: If the conversation does not exist
+    """
+    if get_storage_type() == "mysql":
+        stmt = text(
+            "UPDATE conversations "
+            "SET messages = JSON_ARRAY_APPEND(COALESCE(messages, JSON_ARRAY()), '$', CAST(:message AS JSON)), "
+            "message_count = message_count + 1, "
+            "updated_at = NOW() "
+            "WHERE id = :id"
+        )
+    else:
+        stmt = text(
+            "UPDATE conversations "
+            "SET messages = COALESCE(messages, '[]'::jsonb) "
+            "|| jsonb_build_array(CAST(:message AS jsonb)), "
+            "message_count = message_count + 1, "
+            "updated_at = now() "
+            "WHERE id = :id"
+        )
+
+    with session_scope() as db:
+        result = db.execute(stmt, {"id": conversation_id, "message": json.dumps(message)})
+        db.commit()
+
+    if result.rowcount == 0:
+        raise ValueError(f"Conversation {conversation_id} not found")
+
+
+def _db_update_conversation_title(conversation_id: str, title: str):
+    """
+    Set a conversation's title with one UPDATE, leaving messages untouched.
+
+    Raises:
+        ValueError: If the conversation does not exist
+    """
+    with session_scope() as db:
+        result = db.execute(
+            update(ConversationModel)
+            .where(ConversationModel.id == conversation_id)
+            .values(title=title)
+        )
+        db.commit()
+
+    if result.rowcount == 0:
+        raise ValueError(f"Conversation {conversation_id} not found")
+
+
+def _db_list_conversations(
+    limit: Optional[int] = None,
+    cursor: Optional[Tuple[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    List conversations from database, newest first (keyset-paginated).
+
+    Reads only the stored message_count, so the query is served from the
+    idx_conversations_list index without touching the messages column.
+    """
+    stmt = select(
+        ConversationModel.id,
+        ConversationModel.created_at,
+        ConversationModel.title,
+        ConversationModel.message_count
+    )
+
+    if cursor is not None:
+        cursor_created_at = datetime.fromisoformat(cursor[0])
+        stmt = stmt.where(
+            tuple_(ConversationModel.created_at, ConversationModel.id)
+            < tuple_(cursor_created_at, cursor[1])
+        )
+
+    stmt = stmt.order_by(
+        ConversationModel.created_at.desc(),
+        ConversationModel.id.desc()
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    with session_scope() as db:
+        rows = db.execute(stmt).all()
+
+    return [
+        {
+            "id": c.id,
+            "created_at": c.created_at.isoformat(),
+            "title": c.title,
+            "message_count": c.message_count
+        }
+        for c in rows
+    ]
 
 
 def _db_delete_conversation(conversation_id: str) -> bool:
     """Delete conversation from database."""
-    db = SessionLocal()
-    try:
+    with session_scope() as db:
         conversation = db.query(ConversationModel).filter(
             ConversationModel.id == conversation_id
         ).first()
@@ -184,13 +440,59 @@ def _db_delete_conversation(conversation_id: str) -> bool:
         db.delete(conversation)
         db.commit()
         return True
-    finally:
-        db.close()
+
+
+def _db_delete_conversations(conversation_ids: List[str]) -> int:
+    """Delete several conversations with one statement; returns rows deleted."""
+    with session_scope() as db:
+        deleted = db.query(ConversationModel).filter(
+            ConversationModel.id.in_(conversation_ids)
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+
+# ==================== CONVERSATION CACHE ====================
+
+# Recently loaded conversations; avoids re-reading the same file/row several
+# times while one message is processed
+_CONVERSATION_CACHE: TTLCache = TTLCache(maxsize=512, ttl=60)
+_CACHE_LOCK = threading.Lock()
+
+# Bumped by every invalidation. A read only fills the cache if no write
+# completed while it was in flight, so a slow read of the old file cannot
+# re-cache data that a concurrent save has already replaced.
+_CACHE_GENERATION = 0
+
+
+def _invalidate_cached_conversation(conversation_id: str):
+    """Drop a conversation from the in-process cache after a write."""
+    global _CACHE_GENERATION
+    with _CACHE_LOCK:
+        _CACHE_GENERATION += 1
+        _CONVERSATION_CACHE.pop(conversation_id, None)
+
+
+# One lock per conversation serializing read-modify-write updates; an entry
+# disappears once no coroutine holds or waits on it
+_CONVERSATION_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _conversation_lock(conversation_id: str) -> asyncio.Lock:
+    """Return the update lock for a conversation, creating it if needed."""
+    lock = _CONVERSATION_LOCKS.get(conversation_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _CONVERSATION_LOCKS[conversation_id] = lock
+    return lock
 
 
 # ==================== UNIFIED API (Auto-switches based on flag) ====================
+#
+# The public API is async: file and database I/O run in worker threads via
+# asyncio.to_thread so a slow disk or query never stalls the event loop.
 
-def create_conversation(conversation_id: str) -> Dict[str, Any]:
+async def create_conversation(conversation_id: str) -> Dict[str, Any]:
     """
     Create a new conversation.
 
@@ -203,16 +505,18 @@ def create_conversation(conversation_id: str) -> Dict[str, Any]:
         New conversation dict
     """
     if is_using_database():
-        return _db_create_conversation(conversation_id)
+        return await asyncio.to_thread(_db_create_conversation, conversation_id)
     else:
-        return _json_create_conversation(conversation_id)
+        return await asyncio.to_thread(_json_create_conversation, conversation_id)
 
 
-def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
+async def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     """
     Load a conversation from storage.
 
     Automatically uses database or JSON based on DATABASE_TYPE.
+    Results are cached briefly in-process; writes through this module
+    invalidate the entry. Mutate the returned dict only to save it back.
 
     Args:
         conversation_id: Unique identifier for the conversation
@@ -220,13 +524,25 @@ def get_conversation(conversation_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Conversation dict or None if not found
     """
+    with _CACHE_LOCK:
+        cached = _CONVERSATION_CACHE.get(conversation_id)
+        generation = _CACHE_GENERATION
+    if cached is not None:
+        return cached
+
     if is_using_database():
-        return _db_get_conversation(conversation_id)
+        conversation = await asyncio.to_thread(_db_get_conversation, conversation_id)
     else:
-        return _json_get_conversation(conversation_id)
+        conversation = await asyncio.to_thread(_json_get_conversation, conversation_id)
 
+    if conversation is not None:
+        with _CACHE_LOCK:
+            if _CACHE_GENERATION == generation:
+                _CONVERSATION_CACHE[conversation_id] = conversation
+    return conversation
 
-def save_conversation(conversation: Dict[str, Any]):
+
+async def save_conversation(conversation: Dict[str, Any]):
     """
     Save a conversation to storage.
 
@@ -235,28 +551,69 @@ def save_conversation(conversation: Dict[str, Any]):
     Args:
         conversation: Conversation dict to save
     """
-    if is_using_database():
-        _db_save_conversation(conversation)
-    else:
-        _json_save_conversation(conversation)
+    try:
+        if is_using_database():
+            await asyncio.to_thread(_db_save_conversation, conversation)
+        else:
+            await asyncio.to_thread(_json_save_conversation, conversation)
+    finally:
+        _invalidate_cached_conversation(conversation['id'])
 
 
-def list_conversations() -> List[Dict[str, Any]]:
+async def list_conversations(
+    limit: Optional[int] = None,
+    cursor: Optional[Tuple[str, str]] = None
+) -> List[Dict[str, Any]]:
     """
-    List all conversations (metadata only).
+    List conversations (metadata only), newest first.
 
     Automatically uses database or JSON based on DATABASE_TYPE.
 
+    Args:
+        limit: Maximum number of conversations to return (None = all)
+        cursor: (created_at, id) of the last conversation on the previous page;
+            only conversations strictly older than it are returned
+
     Returns:
         List of conversation metadata dicts
     """
     if is_using_database():
-        return _db_list_conversations()
+        return await asyncio.to_thread(_db_list_conversations, limit, cursor)
     else:
-        return _json_list_conversations()
+        return await asyncio.to_thread(_json_list_conversations, limit, cursor)
+
+
+async def _append_message(conversation_id: str, message: Dict[str, Any]):
+    """
+    Append a message to a conversation.
+
+    Databases append in place; JSON storage rewrites the file. Updates to
+    the same conversation are serialized so none is lost.
+
+    Raises:
+        ValueError: If the conversation does not exist
+    """
+    async with _conversation_lock(conversation_id):
+        if is_using_database():
+            try:
+                await asyncio.to_thread(_db_append_message, conversation_id, message)
+            finally:
+                _invalidate_cached_conversation(conversation_id)
+            return
+
+        conversation = await get_conversation(conversation_id)
+        if conversation is None:
+            raise ValueError(f"Conversation {conversation_id} not found")
+
+        # Save a copy; the loaded dict may be the shared cached one and
+        # must not change unless the write succeeds
+        await save_conversation({
+            **conversation,
+            "messages": [*conversation["messages"], message]
+        })
 
 
-def add_user_message(conversation_id: str, content: str):
+async def add_user_message(conversation_id: str, content: str):
     """
     Add a user message to a conversation.
 
@@ -264,19 +621,13 @@ def add_user_message(conversation_id: str, content: str):
         conversation_id: Conversation identifier
         content: User message content
     """
-    conversation = get_conversation(conversation_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
-
-    conversation["messages"].append({
+    await _append_message(conversation_id, {
         "role": "user",
         "content": content
     })
 
-    save_conversation(conversation)
-
 
-def add_assistant_message(
+async def add_assistant_message(
     conversation_id: str,
     stage1: List[Dict[str, Any]],
     stage2: List[Dict[str, Any]],
@@ -293,11 +644,7 @@ def add_assistant_message(
         stage3: Final synthesized response
         metadata: Optional metadata (e.g., tool outputs, token savings)
     """
-    conversation = get_conversation(conversation_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
-
-    conversation["messages"].append({
+    await _append_message(conversation_id, {
         "role": "assistant",
         "stage1": stage1,
         "stage2": stage2,
@@ -305,26 +652,34 @@ def add_assistant_message(
         "metadata": metadata
     })
 
-    save_conversation(conversation)
 
-
-def update_conversation_title(conversation_id: str, title: str):
+async def update_conversation_title(conversation_id: str, title: str):
     """
     Update the title of a conversation.
 
     Args:
         conversation_id: Conversation identifier
         title: New title for the conversation
+
+    Raises:
+        ValueError: If the conversation does not exist
     """
-    conversation = get_conversation(conversation_id)
-    if conversation is None:
-        raise ValueError(f"Conversation {conversation_id} not found")
+    async with _conversation_lock(conversation_id):
+        if is_using_database():
+            try:
+                await asyncio.to_thread(_db_update_conversation_title, conversation_id, title)
+            finally:
+                _invalidate_cached_conversation(conversation_id)
+            return
+
+        conversation = await get_conversation(conversation_id)
+        if conversation is None:
+            raise ValueError(f"Conversation {conversation_id} not found")
 
-    conversation["title"] = title
-    save_conversation(conversation)
+        await save_conversation({**conversation, "title": title})
 
 
-def delete_conversation(conversation_id: str) -> bool:
+async def delete_conversation(conversation_id: str) -> bool:
     """
     Delete a conversation from storage.
 
@@ -337,14 +692,46 @@ def delete_conversation(conversation_id: str) -> bool:
     Returns:
         True if conversation was deleted, False if not found
     """
-    if is_using_database():
-        return _db_delete_conversation(conversation_id)
-    else:
-        return _json_delete_conversation(conversation_id)
+    try:
+        if is_using_database():
+            return await asyncio.to_thread(_db_delete_conversation, conversation_id)
+        else:
+            return await asyncio.to_thread(_json_delete_conversation, conversation_id)
+    finally:
+        _invalidate_cached_conversation(conversation_id)
+
+
+async def delete_conversations(conversation_ids: List[str]) -> int:
+    """
+    Delete several conversations at once.
+
+    Databases remove them in a single DELETE; JSON storage unlinks the
+    files in one pass. Unknown or malformed IDs (containing path
+    separators or '..') are ignored.
+
+    Args:
+        conversation_ids: Identifiers of the conversations to delete
+
+    Returns:
+        Number of conversations that were deleted
+    """
+    conversation_ids = [cid for cid in conversation_ids if _is_safe_conversation_id(cid)]
+    if not conversation_ids:
+        return 0
+
+    try:
+        if is_using_database():
+            return await asyncio.to_thread(_db_delete_conversations, conversation_ids)
+        else:
+            return await asyncio.to_thread(_json_delete_conversations, conversation_ids)
+    finally:
+        for conversation_id in conversation_ids:
+            _invalidate_cached_conversation(conversation_id)
 
 
 # ==================== UTILITY FUNCTIONS ====================
 
+@lru_cache(maxsize=1)
 def get_storage_info() -> Dict[str, str]:
     """
     Get information about current storage backend.
@@ -7,7 +7,9 @@ Use `get_available_tools()` to fetch the enabled tools list based on environment
 from __future__ import annotations
 
 import os
-from typing import List
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
 # Tool import: prefer langchain_core, fall back to langchain.tools for older installs
 try:
@@ -18,6 +20,7 @@ except ImportError:  # pragma: no cover
 from langchain_community.tools import DuckDuckGoSearchRun, WikipediaQueryRun, ArxivQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
 import yfinance as yf
+from cachetools import TTLCache
 
 # Optional: Python REPL from langchain_experimental; fall back to a simple evaluator
 try:
@@ -25,6 +28,11 @@ try:
 except ImportError:  # pragma: no cover
     PythonREPLTool = None
 
+# Recent stock lookups by symbol. No custom session is passed to yfinance:
+# current releases require curl_cffi sessions and already reuse one internally.
+_TICKER_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=30)
+_TICKER_CACHE_LOCK = threading.Lock()
+
 # Optional: Tavily (paid, flag + key)
 try:
     from langchain_community.tools.tavily_search import TavilySearchResults
@@ -32,6 +40,7 @@ except Exception:  # pragma: no cover
     TavilySearchResults = None
 
 
+@lru_cache(maxsize=1)
 def calculator_tool() -> Tool:
     """Calculator/REPL tool (always available, no API key)."""
     if PythonREPLTool is not None:
@@ -61,6 +70,7 @@ def calculator_tool() -> Tool:
     )
 
 
+@lru_cache(maxsize=1)
 def wikipedia_tool() -> Tool:
     """Wikipedia lookup (free)."""
     wikipedia = WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper())
@@ -71,6 +81,7 @@ def wikipedia_tool() -> Tool:
     )
 
 
+@lru_cache(maxsize=1)
 def arxiv_tool() -> Tool:
     """ArXiv search (free)."""
     arxiv = ArxivQueryRun()
@@ -81,6 +92,7 @@ def arxiv_tool() -> Tool:
     )
 
 
+@lru_cache(maxsize=1)
 def duckduckgo_tool() -> Tool:
     """DuckDuckGo web search (free)."""
     try:
@@ -94,6 +106,7 @@ def duckduckgo_tool() -> Tool:
         return None
 
 
+@lru_cache(maxsize=1)
 def yahoo_finance_tool() -> Tool:
     """Yahoo Finance stock data (free)."""
 
@@ -102,8 +115,13 @@ def yahoo_finance_tool() -> Tool:
         if not symbol:
             return "Error: missing ticker symbol"
 
+        with _TICKER_CACHE_LOCK:
+            cached = _TICKER_CACHE.get(symbol)
+        if cached is not None:
+            return cached
+
         try:
-            stock = yf.Ticker(ticker)
+            stock = yf.Ticker(symbol)
             price = None
             market_cap = None
 
@@ -113,21 +131,24 @@ def yahoo_finance_tool() -> Tool:
                 price = getattr(fast_info, "last_price", None)
                 market_cap = getattr(fast_info, "market_cap", None)
 
-            if price is None:
+            # .info is a much slower full quote request; only when fast_info had nothing
+            if price is None and market_cap is None:
                 info = stock.info
                 price = info.get("currentPrice")
                 market_cap = info.get("marketCap")
 
-            # Format price if present
-            if isinstance(price, (int, float)):
-                price_str = f"${price:,.2f}"
-            else:
-                price_str = "N/A"
-
-            return f"{symbol}: {price_str}"
         except Exception as exc:  # pragma: no cover
             return f"Error fetching {ticker}: {exc}"
 
+        # A missing price is often a transient Yahoo hiccup; don't cache it
+        if not isinstance(price, (int, float)):
+            return f"{symbol}: N/A"
+
+        result = f"{symbol}: ${price:,.2f}"
+        with _TICKER_CACHE_LOCK:
+            _TICKER_CACHE[symbol] = result
+        return result
+
     return Tool(
         name="stock_data",
         func=get_stock_price,
@@ -135,6 +156,7 @@ def yahoo_finance_tool() -> Tool:
     )
 
 
+@lru_cache(maxsize=1)
 def tavily_tool(api_key: str) -> Tool:
     """Tavily search (paid, requires key + flag)."""
     if TavilySearchResults is None:
@@ -153,27 +175,67 @@ def tavily_tool(api_key: str) -> Tool:
     )
 
 
-def get_available_tools() -> List[Tool]:
-    """Return enabled tools based on environment flags."""
-    tools: List[Tool] = [
-        calculator_tool(),
-        wikipedia_tool(),
-        arxiv_tool(),
-        duckduckgo_tool(),
-        yahoo_finance_tool(),
-    ]
+class LazyToolList(Sequence):
+    """
+    Enabled tools, each constructed only when first requested.
+
+    Iterating or indexing builds every tool; `get(name)` builds just the
+    one asked for, so a request that only needs Wikipedia never sets up
+    the REPL, search or finance clients.
+    """
+
+    def __init__(self, factories: List[Tuple[str, Callable[[], Optional[Tool]]]]):
+        self._factories: Dict[str, Callable[[], Optional[Tool]]] = dict(factories)
+        self._tools: Dict[str, Optional[Tool]] = {}
 
-    # Drop any None entries (e.g., missing ddgs dependency)
-    tools = [t for t in tools if t is not None]
+    def get(self, name: str) -> Optional[Tool]:
+        """Return the named tool, or None if it is disabled or unavailable."""
+        if name not in self._tools:
+            factory = self._factories.get(name)
+            try:
+                self._tools[name] = factory() if factory is not None else None
+            except Exception:
+                # Fail silently here; downstream can log if desired
+                self._tools[name] = None
+        return self._tools[name]
 
+    def __iter__(self) -> Iterator[Tool]:
+        for name in self._factories:
+            tool = self.get(name)
+            if tool is not None:
+                yield tool
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def __getitem__(self, index):
+        return list(iter(self))[index]
+
+
+def get_available_tools() -> LazyToolList:
+    """
+    Return enabled tools based on environment flags.
+
+    The list is reused until the Tavily flag or key changes; individual
+    tools are only constructed when first used.
+    """
     enable_tavily = os.getenv("ENABLE_TAVILY", "false").lower() == "true"
     api_key = os.getenv("TAVILY_API_KEY")
+    return _build_tools(enable_tavily, api_key)
+
+
+@lru_cache(maxsize=4)
+def _build_tools(enable_tavily: bool, api_key: Optional[str]) -> LazyToolList:
+    """Map tool names to factories for one combination of env flags."""
+    factories: List[Tuple[str, Callable[[], Optional[Tool]]]] = [
+        ("calculator", calculator_tool),
+        ("wikipedia", wikipedia_tool),
+        ("arxiv", arxiv_tool),
+        ("web_search", duckduckgo_tool),  # None if the ddgs dependency is missing
+        ("stock_data", yahoo_finance_tool),
+    ]
 
     if enable_tavily and api_key:
-        try:
-            tools.append(tavily_tool(api_key))
-        except Exception:
-            # Fail silently here; downstream can log if desired
-            pass
+        factories.append(("tavily_search", lambda: tavily_tool(api_key)))
 
-    return tools
+    return LazyToolList(factories)
@@ -185,6 +185,19 @@ function App() {
             });
             break;
 
+          case 'stage3_delta':
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              lastMsg.stage3 = {
+                model: event.data.model,
+                response: (lastMsg.stage3?.response || '') + event.data.delta,
+              };
+              lastMsg.loading.stage3 = false;
+              return { ...prev, messages };
+            });
+            break;
+
           case 'stage3_complete':
             setCurrentConversation((prev) => {
               const messages = [...prev.messages];
@@ -75,15 +75,7 @@ export const api = {
    * @returns {Promise<void>}
    */
   async sendMessageStream(conversationId, content, onEvent, temporary = false) {
-    let context = [];
-
-    // Get conversation context (skip for temporary chats)
-    if (!temporary) {
-      const conversation = await this.getConversation(conversationId);
-      // Extract last 6 messages as context (3 exchanges)
-      context = conversation.messages.slice(-6);
-    }
-
+    // Saved conversations: the backend reads the history from storage
     const response = await fetch(
       `${API_BASE}/api/conversations/${conversationId}/message/stream`,
       {
@@ -93,7 +85,6 @@ export const api = {
         },
         body: JSON.stringify({
           content,
-          context,
           temporary  // Send temporary flag
         }),
       }
@@ -165,4 +156,25 @@ export const api = {
     }
     return response.json();
   },
+
+  /**
+   * Delete several conversations at once.
+   * @param {string[]} conversationIds - The conversation IDs
+   */
+  async deleteConversations(conversationIds) {
+    const response = await fetch(
+      `${API_BASE}/api/conversations/bulk-delete`,
+      {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ ids: conversationIds }),
+      }
+    );
+    if (!response.ok) {
+      throw new Error('Failed to delete conversations');
+    }
+    return response.json();
+  },
 };
@@ -0,0 +1,68 @@
+"""Stage-1 history prompt: the cacheable prefix must stay stable across turns."""
+
+import unittest
+
+from backend.council import _CONTEXT_STEP, _build_context_messages
+
+
+def _history(turns):
+    """Stored messages after `turns` complete exchanges (user + assistant)."""
+    messages = []
+    for i in range(turns):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append({
+            "role": "assistant",
+            "stage1": [],
+            "stage2": [],
+            "stage3": {"model": "chairman", "response": f"answer {i}"},
+        })
+    return messages
+
+
+def _cacheable(messages):
+    flagged = [m for m in messages if m.get("cacheable")]
+    return flagged[0]["content"] if flagged else None
+
+
+class ContextPrefixTest(unittest.TestCase):
+    def test_cacheable_block_is_identical_between_step_boundaries(self):
+        blocks = {}
+        for turn in range(12):
+            context = _history(turn)
+            messages = _build_context_messages(context)
+            block = _cacheable(messages)
+
+            boundary = len(context) // _CONTEXT_STEP * _CONTEXT_STEP
+            if boundary == 0:
+                self.assertIsNone(block)
+                continue
+
+            # Always the first message, so it is a true prompt prefix
+            self.assertTrue(messages[0].get("cacheable"))
+            if boundary in blocks:
+                self.assertEqual(blocks[boundary], block)
+            blocks[boundary] = block
+
+        # The prefix advances only when a new step boundary is crossed
+        self.assertGreater(len(blocks), 1)
+        self.assertEqual(len(set(blocks.values())), len(blocks))
+
+    def test_newer_messages_follow_uncached(self):
+        context = _history(4)  # 8 messages: boundary at 6
+        messages = _build_context_messages(context)
+
+        self.assertEqual(len(messages), 2)
+        self.assertNotIn("cacheable", messages[1])
+        self.assertIn("question 3", messages[1]["content"])
+        self.assertNotIn("question 3", messages[0]["content"])
+
+    def test_short_history_is_a_single_uncached_message(self):
+        messages = _build_context_messages(_history(1))
+
+        self.assertEqual(len(messages), 1)
+        self.assertNotIn("cacheable", messages[0])
+        self.assertTrue(messages[0]["content"].startswith("Previous conversation:"))
+
+
+if __name__ == "__main__":
+    unittest.main()